@@ -29,10 +29,32 @@ __all__ = [
     'BinaryContext',
     'get_binary_context',
     'set_binary_context',
+    'QuantizationAnalyzer',
+    'QuantizationStats',
+    'find_dtype',
+    'Polynomial',
+    'LookupTable',
+    'bitslice',
+    'bitconcat',
+    'FieldPacker',
+    'ingest',
+    'Column',
+    'save_column',
+    'load_column',
+    'simulate',
 ]
 
+from chainfix.analysis import find_dtype
+from chainfix.analysis import QuantizationAnalyzer
+from chainfix.analysis import QuantizationStats
 from chainfix.binary import Fixb
 from chainfix.binary import Ufixb
+from chainfix.bits import bitconcat
+from chainfix.bits import bitslice
+from chainfix.bits import FieldPacker
+from chainfix.columnar import Column
+from chainfix.columnar import load_column
+from chainfix.columnar import save_column
 from chainfix.context import BinaryContext
 from chainfix.context import DecimalContext
 from chainfix.context import get_binary_context
@@ -45,3 +67,7 @@ from chainfix.helpers import Fixb32
 from chainfix.helpers import Fixd32
 from chainfix.helpers import Ufixb32
 from chainfix.helpers import Ufixd32
+from chainfix.ingest import ingest
+from chainfix.polynomial import LookupTable
+from chainfix.polynomial import Polynomial
+from chainfix.simulation import simulate
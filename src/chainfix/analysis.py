@@ -0,0 +1,267 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Type
+
+from chainfix.fixed_point import _FixedPoint
+from chainfix.fixed_point import dtype_info
+from chainfix.fixed_point import exact_ratio
+from chainfix.fixed_point import float_stored_integer
+from chainfix.fixed_point import FromTypes
+from chainfix.fixed_point import handle_overflow
+from chainfix.fixed_point import scale_ratio
+from chainfix.fixed_point import to_stored_integer
+
+__all__ = [
+    'ErrorAccumulator',
+    'QuantizationStats',
+    'QuantizationAnalyzer',
+    'analyze',
+    'find_dtype',
+    'required_wordlength',
+    'value_range',
+]
+
+Candidate = Tuple[Optional[int], int]
+
+
+# --------------------------------------------------------------------------
+# Quantization Error Statistics
+# --------------------------------------------------------------------------
+
+class QuantizationStats(NamedTuple):
+    """Quantization error produced by a fixed-point data type."""
+    wordlength: int
+    precision: int
+    count: int
+    overflows: int
+    max_abs_error: float
+    rms_error: float
+    sqnr: float
+
+
+class ErrorAccumulator:
+    """Running error statistics of a quantized signal.
+
+    Accumulators of separate chunks of a signal can be merged, e.g. to
+    combine results computed in different processes.
+    """
+
+    __slots__ = ('count', 'overflows', 'max_abs_error',
+                 'sum_sq_error', 'sum_sq_signal')
+
+    def __init__(self):
+        self.count = 0
+        self.overflows = 0
+        self.max_abs_error = 0.0
+        self.sum_sq_error = 0.0
+        self.sum_sq_signal = 0.0
+
+    def add(self, reference: float, quantized: float,
+            overflow: bool = False) -> None:
+        error = abs(quantized - reference)
+        self.count += 1
+        self.overflows += overflow
+        if error > self.max_abs_error:
+            self.max_abs_error = error
+        self.sum_sq_error += error * error
+        self.sum_sq_signal += reference * reference
+
+    def merge(self, other: 'ErrorAccumulator') -> None:
+        self.count += other.count
+        self.overflows += other.overflows
+        self.max_abs_error = max(self.max_abs_error, other.max_abs_error)
+        self.sum_sq_error += other.sum_sq_error
+        self.sum_sq_signal += other.sum_sq_signal
+
+    def stats(self, wordlength: int, precision: int) -> QuantizationStats:
+        if self.count:
+            rms_error = math.sqrt(self.sum_sq_error / self.count)
+        else:
+            rms_error = 0.0
+        if self.sum_sq_error == 0:
+            sqnr = math.inf
+        elif self.sum_sq_signal == 0:
+            sqnr = -math.inf
+        else:
+            sqnr = 10 * math.log10(self.sum_sq_signal / self.sum_sq_error)
+        return QuantizationStats(wordlength, precision, self.count,
+                                 self.overflows, self.max_abs_error,
+                                 rms_error, sqnr)
+
+
+# --------------------------------------------------------------------------
+# Range Finding
+# --------------------------------------------------------------------------
+
+def value_range(values: Iterable[FromTypes]) -> Tuple[float, float]:
+    """Returns the (min, max) of `values`, consumed in a single pass."""
+    lower = math.inf
+    upper = -math.inf
+    for x in values:
+        if x < lower:
+            lower = x
+        if x > upper:
+            upper = x
+    if lower > upper:
+        raise ValueError('Cannot find the range of an empty dataset')
+    return lower, upper
+
+
+def required_wordlength(cls: Type[_FixedPoint], lower: FromTypes,
+                        upper: FromTypes, precision: int) -> int:
+    """Minimum wordlength of `cls` that represents `lower` to `upper`
+    with the given precision, without overflow.
+    """
+    rounding = cls.get_current_context().rounding
+    min_int = to_stored_integer(lower, cls._base, precision, rounding)
+    max_int = to_stored_integer(upper, cls._base, precision, rounding)
+    if cls._signed:
+        wordlength = max(max(max_int, 0).bit_length(),
+                         max(-min_int - 1, 0).bit_length()) + 1
+    else:
+        if min_int < 0:
+            raise ValueError('Unsigned data type cannot represent {}'.format(lower))
+        wordlength = max_int.bit_length()
+    return max(wordlength, 1)
+
+
+# --------------------------------------------------------------------------
+# Quantization Analysis
+# --------------------------------------------------------------------------
+
+class QuantizationAnalyzer:
+    """Streaming quantization error analysis over candidate data types.
+
+    Each candidate is a `(wordlength, precision)` pair of the fixed-point
+    class `cls`.  Data is fed in one or more chunks using `update`, so
+    datasets larger than memory can be analyzed.  Values are rounded, and
+    values outside the range of a candidate overflow, according to the
+    current context.  A candidate wordlength of `None` means unbounded:
+    its reported wordlength is the minimum required to represent the
+    range of the data.
+    """
+
+    def __init__(self, cls: Type[_FixedPoint], candidates: Iterable[Candidate]):
+        self._cls = cls
+        self._candidates = []
+        for wordlength, precision in candidates:
+            if wordlength is None:
+                info = dtype_info(cls._base, cls._signed, 1, precision)
+            else:
+                info = dtype_info(cls._base, cls._signed, wordlength, precision)
+            self._candidates.append(
+                (wordlength, precision, info, ErrorAccumulator())
+            )
+        self._lower = math.inf
+        self._upper = -math.inf
+
+    def update(self, values: Iterable[FromTypes]) -> None:
+        """Accumulates the quantization error of a chunk of values."""
+        ctx = self._cls.get_current_context()
+        overflow = ctx.overflow
+        rounding = ctx.rounding
+        base = self._cls._base
+        candidates = self._candidates
+        for x in values:
+            if x < self._lower:
+                self._lower = x
+            if x > self._upper:
+                self._upper = x
+            # Float fast path per candidate; otherwise decompose the value
+            # once and scale it exactly
+            fast = isinstance(x, float) and math.isfinite(x)
+            ratio = None
+            for wordlength, precision, info, acc in candidates:
+                scale = info.scale
+                stored_integer = None
+                if fast:
+                    stored_integer = float_stored_integer(x, base, precision,
+                                                          rounding)
+                if stored_integer is None:
+                    if ratio is None:
+                        ratio = exact_ratio(x)
+                    stored_integer = scale_ratio(ratio[0], ratio[1], base,
+                                                 precision, rounding)
+                if wordlength is None:
+                    acc.add(x, stored_integer / scale)
+                else:
+                    q = handle_overflow(stored_integer, info, wordlength, overflow)
+                    acc.add(x, q / scale, q != stored_integer)
+
+    @property
+    def range(self) -> Tuple[float, float]:
+        """(min, max) of all values seen so far."""
+        if self._lower > self._upper:
+            raise ValueError('No values have been analyzed')
+        return self._lower, self._upper
+
+    def results(self) -> List[QuantizationStats]:
+        """Error statistics of each candidate, in candidate order."""
+        results = []
+        for wordlength, precision, info, acc in self._candidates:
+            if wordlength is None:
+                if acc.count:
+                    lower, upper = self.range
+                else:
+                    lower, upper = 0, 0
+                wordlength = required_wordlength(self._cls, lower, upper,
+                                                 precision)
+            results.append(acc.stats(wordlength, precision))
+        return results
+
+    def best(self, max_error: Optional[float] = None,
+             min_sqnr: Optional[float] = None) -> Optional[QuantizationStats]:
+        """Smallest candidate that does not overflow and meets the
+        error budget, or None if no candidate qualifies.
+
+        Candidates are ordered by wordlength, then precision.
+        """
+        passing = [
+            s for s in self.results()
+            if s.overflows == 0
+            and (max_error is None or s.max_abs_error <= max_error)
+            and (min_sqnr is None or s.sqnr >= min_sqnr)
+        ]
+        if not passing:
+            return None
+        return min(passing, key=lambda s: (s.wordlength, s.precision))
+
+
+def analyze(values: Iterable[FromTypes], cls: Type[_FixedPoint],
+            candidates: Iterable[Candidate]) -> List[QuantizationStats]:
+    """Quantization error statistics of `values` for each candidate
+    `(wordlength, precision)` of `cls`.
+    """
+    analyzer = QuantizationAnalyzer(cls, candidates)
+    analyzer.update(values)
+    return analyzer.results()
+
+
+def find_dtype(values: Iterable[FromTypes], cls: Type[_FixedPoint],
+               max_error: Optional[float] = None,
+               min_sqnr: Optional[float] = None,
+               precisions: Iterable[int] = range(0, 65)) -> QuantizationStats:
+    """Minimum wordlength and precision of `cls` that covers the range of
+    `values` and meets the error budget.
+
+    The values are consumed in a single pass.
+    """
+    analyzer = QuantizationAnalyzer(cls, [(None, p) for p in precisions])
+    analyzer.update(values)
+    best = analyzer.best(max_error=max_error, min_sqnr=min_sqnr)
+    if best is None:
+        raise ValueError('No data type meets the error budget')
+    return best
@@ -44,7 +44,8 @@ class Fixb(_Fix):
                                )
         return self
 
-    def get_current_context(self):
+    @classmethod
+    def get_current_context(cls):
         return get_binary_context()
 
 
@@ -64,5 +65,6 @@ class Ufixb(_Ufix):
                                )
         return self
 
-    def get_current_context(self):
+    @classmethod
+    def get_current_context(cls):
         return get_binary_context()
@@ -0,0 +1,159 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Type, Union
+
+from chainfix.binary import Ufixb
+from chainfix.fixed_point import _FixedPoint
+from chainfix.fixed_point import dtype_info
+from chainfix.fixed_point import from_unsigned
+from chainfix.fixed_point import FromTypes
+from chainfix.fixed_point import to_unsigned
+
+__all__ = ['bitslice', 'bitconcat', 'FieldPacker']
+
+Field = Tuple[str, Type[_FixedPoint], int, int]
+
+
+# --------------------------------------------------------------------------
+# Bit Slicing and Concatenation
+# --------------------------------------------------------------------------
+
+def bitslice(x: _FixedPoint, msb: int, lsb: int) -> Ufixb:
+    """Bits `msb` down to `lsb` (inclusive) of the stored integer.
+
+    Bit 0 is the least significant bit.  The result is an unsigned
+    integer (`Ufixb` with precision 0) of wordlength `msb - lsb + 1`.
+    """
+    if not 0 <= lsb <= msb < x.wordlength:
+        raise ValueError('Invalid bit slice [{}:{}] of {} bit word'.format(msb, lsb, x.wordlength))
+    wordlength = msb - lsb + 1
+    return Ufixb.from_int(to_unsigned(x.uint >> lsb, wordlength), wordlength, 0)
+
+
+def bitconcat(*values: _FixedPoint) -> Ufixb:
+    """Concatenates the stored integers of `values`.
+
+    The first value occupies the most significant bits.  The result is an
+    unsigned integer (`Ufixb` with precision 0) whose wordlength is the
+    sum of the wordlengths of `values`.
+    """
+    if not values:
+        raise ValueError('Nothing to concatenate')
+    bits = 0
+    wordlength = 0
+    for x in values:
+        bits = (bits << x.wordlength) | x.uint
+        wordlength += x.wordlength
+    return Ufixb.from_int(bits, wordlength, 0)
+
+
+# --------------------------------------------------------------------------
+# Register Field Packing
+# --------------------------------------------------------------------------
+
+class FieldPacker:
+    """Packs fixed-point fields into a single wide word.
+
+    Fields are `(name, cls, wordlength, precision)` tuples.  The first
+    field occupies the most significant bits of the word, like the field
+    listing of a hardware register.
+    """
+
+    def __init__(self, fields: Sequence[Field]):
+        if not fields:
+            raise ValueError('FieldPacker requires at least one field')
+        self.fields = tuple(fields)
+        self._layout = []
+        offset = sum(wordlength for _, _, wordlength, _ in fields)
+        self.wordlength = offset
+        for name, cls, wordlength, precision in fields:
+            offset -= wordlength
+            info = dtype_info(cls._base, cls._signed, wordlength, precision)
+            self._layout.append((name, cls, wordlength, precision, offset, info))
+        if len({name for name, *_ in self._layout}) != len(self._layout):
+            raise ValueError('Field names must be unique')
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, *_ in self._layout]
+
+    def pack(self, values: Mapping[str, Union[_FixedPoint, FromTypes]]) -> int:
+        """Packs one value per field into a word.
+
+        Fixed-point values must match the data type of their field; ints
+        and floats are quantized to it.
+        """
+        word = 0
+        for name, cls, wordlength, precision, offset, _ in self._layout:
+            x = values[name]
+            if isinstance(x, _FixedPoint):
+                if (x.signed, x.wordlength, x.precision) != (cls._signed, wordlength, precision) \
+                        or x.base != cls._base:
+                    raise ValueError('Field {} requires {}(_, {}, {}), got {!r}'.format(
+                        name, cls.__name__, wordlength, precision, x))
+            else:
+                x = cls(x, wordlength, precision)
+            word |= x.uint << offset
+        return word
+
+    def unpack(self, word: int) -> Dict[str, Any]:
+        """Unpacks a word into one fixed-point value per field."""
+        return {
+            name: cls.from_int(
+                from_unsigned(to_unsigned(word >> offset, wordlength),
+                              wordlength, cls._signed),
+                wordlength, precision)
+            for name, cls, wordlength, precision, offset, _ in self._layout
+        }
+
+    def pack_many(self, columns: Mapping[str, Iterable[int]]) -> List[int]:
+        """Packs columns of stored integers (one column per field) into
+        a list of words.
+        """
+        words = None
+        for name, cls, wordlength, precision, offset, info in self._layout:
+            column = list(columns[name])
+            if column and (min(column) < info.min_int or max(column) > info.max_int):
+                raise ValueError('Stored integers of field {} must be in range: {} to {}'.format(
+                    name, info.min_int, info.max_int))
+            mask = (1 << wordlength) - 1
+            if words is None:
+                words = [(x & mask) << offset for x in column]
+            elif len(column) != len(words):
+                raise ValueError('All columns must have the same length')
+            else:
+                words = [w | ((x & mask) << offset) for w, x in zip(words, column)]
+        return words
+
+    def unpack_many(self, words: Iterable[int]) -> Dict[str, List[int]]:
+        """Unpacks words into columns of stored integers (one column per
+        field).
+        """
+        words = list(words)
+        columns = {}
+        for name, cls, wordlength, precision, offset, _ in self._layout:
+            mask = (1 << wordlength) - 1
+            column = [(w >> offset) & mask for w in words]
+            if cls._signed:
+                sign = 1 << (wordlength - 1)
+                column = [x - (x & sign) * 2 for x in column]
+            columns[name] = column
+        return columns
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(self.__class__.__name__, [
+            (name, cls.__name__, wordlength, precision)
+            for name, cls, wordlength, precision in self.fields
+        ])
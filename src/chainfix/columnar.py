@@ -0,0 +1,305 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Sequence
+from itertools import chain, islice
+from typing import Iterable, Iterator, Optional, Type, Union
+
+from chainfix.binary import Fixb
+from chainfix.binary import Ufixb
+from chainfix.decimal import Fixd
+from chainfix.decimal import Ufixd
+from chainfix.fixed_point import _FixedPoint
+from chainfix.fixed_point import dtype_info
+
+__all__ = ['Column', 'save_column', 'save_ints', 'load_column']
+
+# File layout: a 32 byte header followed by the stored integers, each
+# `itemsize` bytes wide, little-endian two's complement.
+#
+#   magic (4s), version (B), base (B), signed (B), pad (x),
+#   wordlength (I), precision (i), itemsize (I), count (Q), pad (4x)
+_MAGIC = b'CHFX'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBBBxIiIQ4x')
+_COUNT_OFFSET = 20
+
+_CHUNK_SIZE = 65536
+
+_CLASSES = {
+    (2, True): Fixb,
+    (2, False): Ufixb,
+    (10, True): Fixd,
+    (10, False): Ufixd,
+}
+
+
+def _itemsize(wordlength: int) -> int:
+    """Bytes per stored integer: a native integer size where possible."""
+    for size in (1, 2, 4, 8):
+        if wordlength <= 8 * size:
+            return size
+    return (wordlength + 7) // 8
+
+
+def _umask() -> int:
+    """Current file mode creation mask of the process."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _typecode(itemsize: int, signed: bool) -> Optional[str]:
+    """Native little-endian typecode with the given size, if any."""
+    if sys.byteorder != 'little':
+        return None
+    for code in ('bhilq' if signed else 'BHILQ'):
+        if array(code).itemsize == itemsize:
+            return code
+    return None
+
+
+class _WideInts(Sequence):
+    """Read-only view of stored integers wider than 64 bits."""
+
+    def __init__(self, buffer: memoryview, itemsize: int, signed: bool):
+        self._buffer = buffer
+        self._itemsize = itemsize
+        self._signed = signed
+
+    def __len__(self) -> int:
+        return len(self._buffer) // self._itemsize
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError('Column index out of range')
+        start = index * self._itemsize
+        return int.from_bytes(self._buffer[start:start + self._itemsize],
+                              'little', signed=self._signed)
+
+
+# --------------------------------------------------------------------------
+# Columns
+# --------------------------------------------------------------------------
+
+class Column(Sequence):
+    """A read-only column of same data type fixed-point values.
+
+    The column wraps a buffer of stored integers, so no fixed-point
+    objects are built until elements are accessed.  Use `ints` for direct
+    access to the stored integers.
+
+    Columns returned by `load_column` keep their file mapped until
+    `close` is called, or the `with` block using the column exits.
+    Slices of `ints` are views of the mapped file, so they must be
+    released (or copied, e.g. with `list`) before the column is closed.
+    """
+
+    def __init__(self, cls: Type[_FixedPoint], wordlength: int, precision: int,
+                 buffer: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        self.cls = cls
+        self.wordlength = wordlength
+        self.precision = precision
+        self.itemsize = _itemsize(wordlength)
+        buffer = memoryview(buffer)
+        if len(buffer) % self.itemsize:
+            raise ValueError('Buffer size must be a multiple of {} bytes'.format(self.itemsize))
+        self._buffer = buffer
+        self._mmap = None  # type: Optional[mmap.mmap]
+        code = _typecode(self.itemsize, cls._signed)
+        if code is None:
+            self._ints = _WideInts(buffer, self.itemsize, cls._signed)
+        else:
+            self._ints = buffer.cast(code)
+
+    @property
+    def ints(self) -> Sequence:
+        """Stored integers (read-only sequence of ints).
+
+        Slices may be views of the column buffer, and must not outlive it.
+        """
+        return self._ints
+
+    def __len__(self) -> int:
+        return len(self._ints)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.cls.from_int(x, self.wordlength, self.precision)
+                    for x in self._ints[index]]
+        return self.cls.from_int(self._ints[index], self.wordlength,
+                                 self.precision)
+
+    def __iter__(self) -> Iterator[_FixedPoint]:
+        from_int = self.cls.from_int
+        wordlength = self.wordlength
+        precision = self.precision
+        for x in self._ints:
+            yield from_int(x, wordlength, precision)
+
+    def close(self) -> None:
+        """Releases the buffer, and unmaps the file of a loaded column.
+
+        Raises BufferError, leaving the file mapped, if views of the stored
+        integers are still in use.  The column can be closed again once
+        they are released.
+        """
+        if isinstance(self._ints, memoryview):
+            self._ints.release()
+        self._buffer.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                raise BufferError('Cannot close column while slices of its stored integers are in use') from None
+            self._mmap = None
+
+    def __enter__(self) -> 'Column':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return '{}({}, {}, {}, len={})'.format(self.__class__.__name__,
+                                               self.cls.__name__,
+                                               self.wordlength,
+                                               self.precision, len(self))
+
+
+# --------------------------------------------------------------------------
+# Export and Import
+# --------------------------------------------------------------------------
+
+def save_ints(path: str, stored_integers: Iterable[int], cls: Type[_FixedPoint],
+              wordlength: int, precision: int) -> int:
+    """Writes stored integers of data type `cls(_, wordlength, precision)`
+    to a column file.  The integers are consumed in chunks, so arbitrarily
+    long iterables can be written.
+
+    The file is written to a temporary file first and only replaces
+    `path` once all values have been written, so a failed write never
+    leaves a partial column behind.
+
+    Returns the number of values written.
+    """
+    base = cls._base
+    signed = cls._signed
+    if _CLASSES.get((base, signed)) is None:
+        raise ValueError('Unsupported data type {}'.format(cls.__name__))
+    info = dtype_info(base, signed, wordlength, precision)
+    itemsize = _itemsize(wordlength)
+    code = _typecode(itemsize, signed)
+
+    count = 0
+    it = iter(stored_integers)
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + name, suffix='.tmp',
+                                    dir=directory)
+    try:
+        # mkstemp creates the file with mode 0600; use the mode open() would
+        os.chmod(tmp_path, 0o666 & ~_umask())
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, base, signed, wordlength,
+                                 precision, itemsize, 0))
+            while True:
+                chunk = list(islice(it, _CHUNK_SIZE))
+                if not chunk:
+                    break
+                if min(chunk) < info.min_int or max(chunk) > info.max_int:
+                    raise ValueError('Stored integers must be in range: {} to {}'.format(info.min_int, info.max_int))
+                if code is None:
+                    f.write(b''.join(x.to_bytes(itemsize, 'little', signed=signed)
+                                     for x in chunk))
+                else:
+                    f.write(array(code, chunk).tobytes())
+                count += len(chunk)
+            f.seek(_COUNT_OFFSET)
+            f.write(struct.pack('<Q', count))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
+def save_column(path: str, values: Iterable[_FixedPoint]) -> int:
+    """Writes same data type fixed-point values to a column file.
+
+    The data type is taken from the first value.  Returns the number of
+    values written.
+    """
+    it = iter(values)
+    try:
+        first = next(it)
+    except StopIteration:
+        raise ValueError('Cannot infer the data type of an empty column') from None
+    cls = type(first)
+    dtype = (first.base, first.signed, first.wordlength, first.precision)
+
+    def stored_integers():
+        for x in chain([first], it):
+            if (x.base, x.signed, x.wordlength, x.precision) != dtype:
+                raise ValueError('Column values must have the same data type: {!r}, {!r}'.format(first, x))
+            yield x.int
+
+    return save_ints(path, stored_integers(), cls, first.wordlength,
+                     first.precision)
+
+
+def load_column(path: str) -> Column:
+    """Memory-maps a column file written by `save_column` or `save_ints`.
+
+    Stored integers are read lazily from the mapped file, which stays
+    mapped until the column is closed.
+    """
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        column = _map_column(path, mm)
+    except BaseException:
+        mm.close()
+        raise
+    column._mmap = mm
+    return column
+
+
+def _map_column(path: str, mm: mmap.mmap) -> Column:
+    if len(mm) < _HEADER.size:
+        raise ValueError('{} is not a chainfix column file'.format(path))
+    (magic, version, base, signed, wordlength, precision, itemsize,
+     count) = _HEADER.unpack_from(mm)
+    if magic != _MAGIC:
+        raise ValueError('{} is not a chainfix column file'.format(path))
+    if version != _VERSION:
+        raise ValueError('Unsupported column file version {}'.format(version))
+    cls = _CLASSES.get((base, bool(signed)))
+    if cls is None or itemsize != _itemsize(wordlength):
+        raise ValueError('Unsupported data type in {}'.format(path))
+    end = _HEADER.size + count * itemsize
+    if len(mm) < end:
+        raise ValueError('{} is truncated'.format(path))
+    with memoryview(mm) as view:
+        return Column(cls, wordlength, precision, view[_HEADER.size:end])
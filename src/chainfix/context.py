@@ -24,20 +24,31 @@ class Overflow(Enum):
     WRAP = 2
 
 
+class Rounding(Enum):
+    HALF_EVEN = 1   # Round to nearest, ties to even (convergent)
+    HALF_AWAY = 2   # Round to nearest, ties away from zero
+    FLOOR = 3       # Round toward negative infinity
+    CEIL = 4        # Round toward positive infinity
+    TRUNCATE = 5    # Round toward zero
+
+
 class _Context:
 
     def __init__(self,
                  wordlength: Optional[int] = None,
                  precision: Optional[int] = None,
-                 overflow: Optional[Overflow] = None):
+                 overflow: Optional[Overflow] = None,
+                 rounding: Optional[Rounding] = None):
         dc = self.get_default()
         self.precision = precision if precision is not None else dc.precision
         self.wordlength = wordlength if wordlength is not None else dc.wordlength
         self.overflow = overflow if overflow is not None else dc.overflow
+        self.rounding = rounding if rounding is not None else dc.rounding
 
     def copy(self):
         """Returns a deep copy from self."""
-        nc = self.__class__(self.wordlength, self.precision, self.overflow)
+        nc = self.__class__(self.wordlength, self.precision, self.overflow,
+                            self.rounding)
         return nc
 
     __copy__ = copy
@@ -46,11 +57,12 @@ class _Context:
         raise NotImplementedError
 
     def __repr__(self) -> str:
-        return '{}(wordlength={}, precision={}, overflow={})'.format(
+        return '{}(wordlength={}, precision={}, overflow={}, rounding={})'.format(
             self.__class__.__name__,
             self.wordlength,
             self.precision,
-            self.overflow)
+            self.overflow,
+            self.rounding)
 
 
 class DecimalContext(_Context):
@@ -80,13 +92,15 @@ class BinaryContext(_Context):
 DefaultDecimalContext = DecimalContext(
     wordlength=256,
     precision=18,
-    overflow=Overflow.SATURATE
+    overflow=Overflow.SATURATE,
+    rounding=Rounding.HALF_EVEN
 )
 
 DefaultBinaryContext = BinaryContext(
     wordlength=32,
     precision=16,
-    overflow=Overflow.SATURATE
+    overflow=Overflow.SATURATE,
+    rounding=Rounding.HALF_EVEN
 )
 
 # Context Functions
@@ -42,7 +42,8 @@ class Fixd(_Fix):
                                )
         return self
 
-    def get_current_context(self):
+    @classmethod
+    def get_current_context(cls):
         return get_decimal_context()
 
 
@@ -62,5 +63,6 @@ class Ufixd(_Ufix):
                                )
         return self
 
-    def get_current_context(self):
+    @classmethod
+    def get_current_context(cls):
         return get_decimal_context()
@@ -13,8 +13,14 @@
 # limitations under the License.
 
 import math
+import numbers
+import sys
 from fractions import Fraction
-from typing import Any, TYPE_CHECKING, TypeVar, Union
+from functools import lru_cache
+from typing import Any, Iterable, List, NamedTuple, TYPE_CHECKING, TypeVar, Union
+
+from chainfix.context import Overflow
+from chainfix.context import Rounding
 
 default_wordlength = None
 default_precision = None
@@ -23,6 +29,230 @@ T = TypeVar("T")
 
 FromTypes = Union[int, float]
 
+_PyHASH_MODULUS = sys.hash_info.modulus
+_FLOAT_MIN = sys.float_info.min
+
+# Bounds of the float fast path for non-binary scaling
+_FAST_MIN = 2.0 ** -900
+_FAST_MAX = 2.0 ** 50
+_FAST_MARGIN = 2.0 ** -48
+
+
+class DtypeInfo(NamedTuple):
+    """Scale and limits of a fixed-point data type."""
+    scale: Union[int, float]
+    min_int: int
+    max_int: int
+    lower_bound: float
+    upper_bound: float
+
+
+@lru_cache(maxsize=4096)
+def dtype_info(base: int, signed: bool, wordlength: int, precision: int) -> DtypeInfo:
+    """Returns the (cached) scale and limits of a fixed-point data type.
+
+    The scale factor is `base ** precision`.  Stored integers must lie in
+    the range `min_int` to `max_int`, which correspond to the real world
+    values `lower_bound` and `upper_bound`.
+    """
+    scale = base ** precision
+    if signed:
+        max_int = int(2 ** (wordlength - 1) - 1)
+        min_int = int(-(2 ** (wordlength - 1)))
+    else:
+        max_int = int(2 ** wordlength - 1)
+        min_int = int(0)
+    return DtypeInfo(scale, min_int, max_int, min_int / scale, max_int / scale)
+
+
+def handle_overflow(stored_integer: int, info: DtypeInfo, wordlength: int,
+                    overflow: Overflow) -> int:
+    """Brings an out-of-range stored integer back into range.
+
+    Depending on `overflow`, the stored integer either saturates at the
+    limits of the data type or wraps around (two's complement).
+    """
+    if info.min_int <= stored_integer <= info.max_int:
+        return stored_integer
+    if overflow is Overflow.WRAP:
+        stored_integer &= (1 << wordlength) - 1
+        if stored_integer > info.max_int:
+            stored_integer -= 1 << wordlength
+        return stored_integer
+    return min(max(stored_integer, info.min_int), info.max_int)
+
+
+def to_unsigned(stored_integer: int, wordlength: int) -> int:
+    """Two's complement bit pattern of a stored integer."""
+    return stored_integer & ((1 << wordlength) - 1)
+
+
+def from_unsigned(bits: int, wordlength: int, signed: bool) -> int:
+    """Stored integer from a two's complement bit pattern."""
+    if signed and bits >> (wordlength - 1):
+        return bits - (1 << wordlength)
+    return bits
+
+
+def round_div(numerator: int, denominator: int,
+              rounding: Rounding = Rounding.HALF_EVEN) -> int:
+    """Exact integer division, rounded according to `rounding`.
+
+    The denominator must be positive.
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    if remainder == 0 or rounding is Rounding.FLOOR:
+        return quotient
+    if rounding is Rounding.CEIL:
+        return quotient + 1
+    if rounding is Rounding.TRUNCATE:
+        return quotient + 1 if quotient < 0 else quotient
+    twice = 2 * remainder
+    if twice > denominator:
+        return quotient + 1
+    if twice < denominator:
+        return quotient
+    # Exactly halfway between quotient and quotient + 1
+    if rounding is Rounding.HALF_AWAY:
+        return quotient + 1 if quotient >= 0 else quotient
+    return quotient + (quotient & 1)
+
+
+def rescale(stored_integer: int, base: int, from_precision: int,
+            to_precision: int, rounding: Rounding = Rounding.HALF_EVEN) -> int:
+    """Converts a stored integer between precisions of the same base."""
+    if to_precision >= from_precision:
+        return stored_integer * base ** (to_precision - from_precision)
+    return round_div(stored_integer, base ** (from_precision - to_precision),
+                     rounding)
+
+
+def round_float(value: float, rounding: Rounding = Rounding.HALF_EVEN) -> int:
+    """Rounds a finite float to an integer according to `rounding`."""
+    if rounding is Rounding.HALF_EVEN:
+        return round(value)
+    if rounding is Rounding.FLOOR:
+        return math.floor(value)
+    if rounding is Rounding.CEIL:
+        return math.ceil(value)
+    if rounding is Rounding.TRUNCATE:
+        return int(value)
+    # value - floor(value) is inexact in (-1, 0), value - trunc(value) is not
+    truncated = math.trunc(value)
+    if abs(value - truncated) >= 0.5:
+        return truncated + 1 if value > 0 else truncated - 1
+    return truncated
+
+
+def exact_ratio(value: Union[FromTypes, Fraction]):
+    """Exact value of an int, float or Fraction as a (numerator,
+    denominator) pair.
+
+    Floats are decomposed with `math.frexp` into an integer mantissa and
+    a power of two.  The denominator is always positive.
+    """
+    if isinstance(value, int):
+        return value, 1
+    if isinstance(value, Fraction):
+        return value.numerator, value.denominator
+    if not math.isfinite(value):
+        raise ValueError('Value {} must be finite'.format(value))
+    mantissa, exponent = math.frexp(value)
+    numerator = int(mantissa * 9007199254740992)  # 2 ** 53, exact
+    exponent -= 53
+    if exponent >= 0:
+        return numerator << exponent, 1
+    return numerator, 1 << -exponent
+
+
+def scale_ratio(numerator: int, denominator: int, base: int, precision: int,
+                rounding: Rounding = Rounding.HALF_EVEN) -> int:
+    """Stored integer of `numerator / denominator` scaled by
+    `base ** precision`, rounded exactly in integer space.
+    """
+    if precision >= 0:
+        numerator *= base ** precision
+    else:
+        denominator *= base ** -precision
+    if denominator == 1:
+        return numerator
+    return round_div(numerator, denominator, rounding)
+
+
+@lru_cache(maxsize=4096)
+def _float_scale(base: int, precision: int) -> float:
+    """Scale factor as a float (inf if it does not fit)."""
+    try:
+        return float(base ** precision)
+    except OverflowError:
+        return math.inf
+
+
+def float_stored_integer(value: float, base: int, precision: int,
+                         rounding: Rounding = Rounding.HALF_EVEN) -> Any:
+    """Fast path of `to_stored_integer` for a finite float.
+
+    For base 2, scaling by a power of two is exact.  For other bases the
+    float product `value * base ** precision` has a relative error below
+    2 ** -52, so its rounding is exact unless it lies within that error of
+    a rounding boundary.  Returns None when float arithmetic cannot decide
+    the exact result.
+    """
+    if base == 2:
+        try:
+            scaled = math.ldexp(value, precision)
+        except OverflowError:
+            return None
+        # Exact, unless the result is subnormal
+        if abs(scaled) >= _FLOAT_MIN or value == 0.0:
+            return round_float(scaled, rounding)
+        return None
+
+    if value == 0.0:
+        return 0
+    scaled = value * _float_scale(base, precision)
+    magnitude = abs(scaled)
+    if not _FAST_MIN <= magnitude < _FAST_MAX:
+        return None
+    margin = magnitude * _FAST_MARGIN
+    truncated = math.trunc(scaled)
+    fraction = abs(scaled - truncated)  # exact
+    if rounding is Rounding.HALF_EVEN or rounding is Rounding.HALF_AWAY:
+        if abs(fraction - 0.5) <= margin:
+            return None
+        if fraction < 0.5:
+            return truncated
+    elif fraction <= margin or fraction >= 1.0 - margin:
+        return None
+    elif rounding is Rounding.TRUNCATE or \
+            (rounding is Rounding.FLOOR) == (scaled > 0):
+        return truncated
+    return truncated + 1 if scaled > 0 else truncated - 1
+
+
+def to_stored_integer(value: Union[FromTypes, Fraction], base: int,
+                      precision: int,
+                      rounding: Rounding = Rounding.HALF_EVEN) -> int:
+    """Exact stored integer of `value` scaled by `base ** precision`.
+
+    Ints and Fractions are scaled exactly.  Floats take the fast path of
+    `float_stored_integer` where possible, and are otherwise decomposed
+    with `math.frexp` (see `exact_ratio`), so rounding takes place in
+    integer space on the exact value of the float.
+    """
+    if isinstance(value, float) and math.isfinite(value):
+        stored_integer = float_stored_integer(value, base, precision, rounding)
+        if stored_integer is not None:
+            return stored_integer
+    numerator, denominator = exact_ratio(value)
+    return scale_ratio(numerator, denominator, base, precision, rounding)
+
+
+@lru_cache(maxsize=4096)
+def _inverse_scale(base: int, precision: int) -> int:
+    """Modular inverse of the scale factor, used for numeric hashing."""
+    return pow(base ** precision, -1, _PyHASH_MODULUS)
+
 
 class _FixedPoint:
     """Fixed-Point Class
@@ -34,6 +264,10 @@ class _FixedPoint:
     of underlying storage.
     The scale factor used to convert between real world values and stored
     integers is `base ** precision`
+
+    Values are immutable and hashable.  Values compare equal, and hash
+    equally, when their real world values are equal, regardless of data
+    type.
     """
 
     __slots__ = ("_int", "_wordlength", "_precision")
@@ -58,29 +292,113 @@ class _FixedPoint:
 
         ctx = self.get_current_context()
 
-        self._wordlength = wordlength if wordlength is not None else ctx.wordlength
-        self._precision = precision if precision is not None else ctx.precision
+        wordlength = wordlength if wordlength is not None else ctx.wordlength
+        precision = precision if precision is not None else ctx.precision
 
         if not isinstance(value, (int, float)):
             raise TypeError("Value {} must be int or float".format(value))
 
-        # Store integer with default saturate-on-overflow logic
-        stored_integer = int(round(value * self._base ** self._precision))
-        if stored_integer > self.max_int:
-            raise ValueError('Value too large for data type.  Must be in range: {} to {}'.format(self.lower_bound, self.upper_bound))
-        elif stored_integer < self.min_int:
-            raise ValueError('Value too small for data type.  Must be in range: {} to {}'.format(self.lower_bound, self.upper_bound))
-        else:
-            self._int = stored_integer
+        stored_integer = to_stored_integer(value, self._base, precision,
+                                           ctx.rounding)
+        self._init(stored_integer, wordlength, precision)
+
+        return self
+
+    @classmethod
+    def quantize(
+            cls,
+            values: Iterable[FromTypes],
+            wordlength: int = default_wordlength,
+            precision: int = default_precision,
+            rounding: Rounding = None
+    ) -> List[int]:
+        """Quantize many values to stored integers of the data type.
+
+        Rounding is exact, as in the constructor, using `rounding` or else
+        the rounding mode of the current context.  Raises ValueError if a
+        value is out of range.
+        """
+        ctx = cls.get_current_context()
+        wordlength = wordlength if wordlength is not None else ctx.wordlength
+        precision = precision if precision is not None else ctx.precision
+        rounding = rounding if rounding is not None else ctx.rounding
+        info = dtype_info(cls._base, cls._signed, wordlength, precision)
+        base = cls._base
+
+        stored_integers = []
+        append = stored_integers.append
+        for value in values:
+            if not isinstance(value, (int, float)):
+                raise TypeError("Value {} must be int or float".format(value))
+            append(to_stored_integer(value, base, precision, rounding))
+
+        if stored_integers:
+            if max(stored_integers) > info.max_int:
+                raise ValueError('Value too large for data type.  Must be in range: {} to {}'.format(info.lower_bound, info.upper_bound))
+            if min(stored_integers) < info.min_int:
+                raise ValueError('Value too small for data type.  Must be in range: {} to {}'.format(info.lower_bound, info.upper_bound))
+        return stored_integers
+
+    @classmethod
+    def from_int(
+            cls,
+            stored_integer: int,
+            wordlength: int = default_wordlength,
+            precision: int = default_precision
+    ) -> Any:
+        """Create a value directly from its stored integer.
+
+        No rounding takes place, so the real world value is exactly
+        `stored_integer * base ** -precision`.
+        """
+        if not isinstance(stored_integer, int):
+            raise TypeError("Stored integer {} must be int".format(stored_integer))
+
+        self = object.__new__(cls)
+
+        if wordlength is None or precision is None:
+            ctx = cls.get_current_context()
+            wordlength = wordlength if wordlength is not None else ctx.wordlength
+            precision = precision if precision is not None else ctx.precision
+
+        self._init(stored_integer, wordlength, precision)
 
         return self
 
+    def _init(self, stored_integer: int, wordlength: int, precision: int) -> None:
+        info = dtype_info(self._base, self._signed, wordlength, precision)
+        if stored_integer > info.max_int:
+            raise ValueError('Value too large for data type.  Must be in range: {} to {}'.format(info.lower_bound, info.upper_bound))
+        elif stored_integer < info.min_int:
+            raise ValueError('Value too small for data type.  Must be in range: {} to {}'.format(info.lower_bound, info.upper_bound))
+
+        # Slots are read-only after construction
+        object.__setattr__(self, '_wordlength', wordlength)
+        object.__setattr__(self, '_precision', precision)
+        object.__setattr__(self, '_int', stored_integer)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('{} objects are immutable'.format(self.__class__.__name__))
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('{} objects are immutable'.format(self.__class__.__name__))
+
+    def __reduce__(self):
+        return self.from_int, (self._int, self._wordlength, self._precision)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     #: Real-world value
     value = property(
         lambda self: float(self._int / self._base ** self._precision)
     )
 
-    def get_current_context(self):
+    @classmethod
+    def get_current_context(cls):
         raise NotImplementedError
 
     # -----------------------------------------------------------------------
@@ -99,29 +417,25 @@ class _FixedPoint:
     # True if data type is signed
     signed = property(lambda self: self._signed)
 
-    upper_bound = property(
-        lambda self: self.max_int / self._base ** self._precision
-    )
+    upper_bound = property(lambda self: self.dtype_info.upper_bound)
 
-    lower_bound = property(
-        lambda self: self.min_int / self._base ** self._precision
-    )
+    lower_bound = property(lambda self: self.dtype_info.lower_bound)
+
+    @property
+    def dtype_info(self) -> DtypeInfo:
+        """Scale and limits of the data type. """
+        return dtype_info(self._base, self._signed,
+                          self._wordlength, self._precision)
 
     @property
     def max_int(self) -> int:
         """Maximum possible stored integer for data type. """
-        if self._signed:
-            return int(2 ** (self._wordlength - 1) - 1)
-        else:
-            return int(2 ** self._wordlength - 1)
+        return self.dtype_info.max_int
 
     @property
     def min_int(self) -> int:
         """Minimum possible stored integer for data type. """
-        if self._signed:
-            return int(-(2 ** (self._wordlength - 1)))
-        else:
-            return int(0)
+        return self.dtype_info.min_int
 
     #: Data type resolution (i.e. value of one LSB)
     lsb = property(lambda self: self._base ** -self._precision)
@@ -129,8 +443,12 @@ class _FixedPoint:
     def as_integer_ratio(self):
         """Return the exact real world value as a ratio of integers. """
 
-        f = Fraction(self._int, self._base ** self._precision)
-        return f.as_integer_ratio()
+        return self._as_fraction().as_integer_ratio()
+
+    def _as_fraction(self) -> Fraction:
+        if self._precision >= 0:
+            return Fraction(self._int, self._base ** self._precision)
+        return Fraction(self._int * self._base ** -self._precision)
 
     # -----------------------------------------------------------------------
     # Stored Integer Properties
@@ -162,6 +480,71 @@ class _FixedPoint:
                 num=(2 ** self._wordlength + self._int), digits=digits
             )
 
+    @property
+    def uint(self) -> int:
+        """Two's complement bit pattern of stored integer (unsigned) """
+        return to_unsigned(self._int, self._wordlength)
+
+    # -----------------------------------------------------------------------
+    # Bitwise operations on the stored integer
+    # -----------------------------------------------------------------------
+
+    def _from_uint(self, bits: int) -> Any:
+        """Same data type, with the given bit pattern."""
+        stored_integer = from_unsigned(bits, self._wordlength, self._signed)
+        return self.from_int(stored_integer, self._wordlength, self._precision)
+
+    def _other_uint(self, other: Any) -> Any:
+        """Bit pattern of the other operand of a bitwise operation.
+
+        Fixed-point operands must have the same data type. Integers are
+        taken as raw bit patterns and truncated to the wordlength.
+        """
+        if isinstance(other, _FixedPoint):
+            if (other._base, other._signed, other._wordlength, other._precision) != \
+                    (self._base, self._signed, self._wordlength, self._precision):
+                raise TypeError('Bitwise operands must have the same data type: {!r}, {!r}'.format(self, other))
+            return other.uint
+        if isinstance(other, int) and not isinstance(other, bool):
+            return to_unsigned(other, self._wordlength)
+        return None
+
+    def __lshift__(self, n: int) -> Any:
+        if not isinstance(n, int) or n < 0:
+            return NotImplemented
+        return self._from_uint(to_unsigned(self.uint << n, self._wordlength))
+
+    def __rshift__(self, n: int) -> Any:
+        # Arithmetic shift for signed types, logical shift for unsigned
+        if not isinstance(n, int) or n < 0:
+            return NotImplemented
+        return self.from_int(self._int >> n, self._wordlength, self._precision)
+
+    def __and__(self, other: Any) -> Any:
+        bits = self._other_uint(other)
+        if bits is None:
+            return NotImplemented
+        return self._from_uint(self.uint & bits)
+
+    def __or__(self, other: Any) -> Any:
+        bits = self._other_uint(other)
+        if bits is None:
+            return NotImplemented
+        return self._from_uint(self.uint | bits)
+
+    def __xor__(self, other: Any) -> Any:
+        bits = self._other_uint(other)
+        if bits is None:
+            return NotImplemented
+        return self._from_uint(self.uint ^ bits)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __invert__(self) -> Any:
+        return self._from_uint(to_unsigned(~self._int, self._wordlength))
+
     # -----------------------------------------------------------------------
     # Representations and conversions
     # -----------------------------------------------------------------------
@@ -182,6 +565,32 @@ class _FixedPoint:
     def __int__(self) -> int:
         return int(self.value)
 
+    # -----------------------------------------------------------------------
+    # Equality and hashing
+    # -----------------------------------------------------------------------
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _FixedPoint):
+            if other._base == self._base:
+                # Compare stored integers at the finer of the two precisions
+                base = self._base
+                precision = max(self._precision, other._precision)
+                return (self._int * base ** (precision - self._precision)
+                        == other._int * base ** (precision - other._precision))
+            return self._as_fraction() == other._as_fraction()
+        if isinstance(other, numbers.Number):
+            return self._as_fraction() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Same as hash(Fraction(self.int, base ** precision)), so that
+        # equal values hash equally across data types and numeric types.
+        if self._precision <= 0:
+            return hash(self._int * self._base ** -self._precision)
+        hash_ = hash(abs(self._int)) * _inverse_scale(self._base, self._precision) % _PyHASH_MODULUS
+        result = hash_ if self._int >= 0 else -hash_
+        return -2 if result == -1 else result
+
 
 class _Fix(_FixedPoint):
     """A Signed fixed point number."""
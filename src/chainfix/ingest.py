@@ -0,0 +1,86 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+from chainfix.decimal import Ufixd
+from chainfix.fixed_point import _FixedPoint
+
+__all__ = ['Batch', 'ingest']
+
+RawAmount = Union[int, str]
+SourceItem = Union[RawAmount, Tuple[RawAmount, int]]
+
+
+class Batch(NamedTuple):
+    """Values of the same data type, built from raw on-chain amounts."""
+    wordlength: int
+    precision: int
+    values: List[_FixedPoint]
+
+
+def _parse_raw(raw: RawAmount) -> int:
+    if isinstance(raw, str):
+        # Decimal strings must not be silently read as hex
+        if not raw.startswith(('0x', '0X')):
+            raise ValueError('Raw amount {!r} must be a 0x-prefixed hex string'.format(raw))
+        return int(raw, 16)
+    if isinstance(raw, int) and not isinstance(raw, bool):
+        return raw
+    raise TypeError('Raw amount {!r} must be int or hex string'.format(raw))
+
+
+async def ingest(source: AsyncIterable[SourceItem],
+                 batch_size: int = 1024,
+                 decimals: Optional[int] = None,
+                 cls: Type[_FixedPoint] = Ufixd,
+                 wordlength: int = 256) -> AsyncIterator[Batch]:
+    """Builds fixed-point values from a stream of raw on-chain amounts.
+
+    Items of `source` are `(raw, decimals)` pairs, or bare raw amounts
+    when `decimals` is given.  A raw amount is the stored integer (e.g. a
+    uint256 token amount), either as an int or a `0x`-prefixed hex string.
+
+    Values are grouped by decimals (i.e. precision) and built directly
+    from the stored integer.  A batch is yielded as soon as a group holds
+    `batch_size` values; remaining groups are yielded when the source is
+    exhausted.  Control is returned to the event loop after each batch.
+    """
+    if batch_size < 1:
+        raise ValueError('batch_size must be positive')
+
+    from_int = cls.from_int
+    pending = {}  # type: Dict[int, List[int]]
+
+    async for item in source:
+        if isinstance(item, tuple):
+            raw, precision = item
+        elif decimals is None:
+            raise ValueError('Decimals of {!r} are unknown'.format(item))
+        else:
+            raw, precision = item, decimals
+
+        group = pending.setdefault(precision, [])
+        group.append(_parse_raw(raw))
+        if len(group) >= batch_size:
+            del pending[precision]
+            yield Batch(wordlength, precision,
+                        [from_int(x, wordlength, precision) for x in group])
+            await asyncio.sleep(0)
+
+    for precision, group in pending.items():
+        yield Batch(wordlength, precision,
+                    [from_int(x, wordlength, precision) for x in group])
+        await asyncio.sleep(0)
@@ -0,0 +1,182 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from bisect import bisect_right
+from typing import Any, Iterable, List, Sequence, Type
+
+from chainfix.binary import Fixb
+from chainfix.fixed_point import _FixedPoint
+from chainfix.fixed_point import default_precision
+from chainfix.fixed_point import default_wordlength
+from chainfix.fixed_point import dtype_info
+from chainfix.fixed_point import FromTypes
+from chainfix.fixed_point import handle_overflow
+from chainfix.fixed_point import rescale
+from chainfix.fixed_point import round_div
+from chainfix.fixed_point import to_stored_integer
+
+__all__ = ['Polynomial', 'LookupTable']
+
+
+# --------------------------------------------------------------------------
+# Fixed Point Function Evaluation
+# --------------------------------------------------------------------------
+
+class _Evaluator:
+    """Evaluates a function of one fixed-point input using stored integers.
+
+    Constants are precompiled into stored integers with the precision of
+    the current context of `cls` (e.g. `BinaryContext` for `Fixb`).
+    Intermediate results are kept at that precision, rounded using the
+    context rounding mode and limited to the context wordlength using the
+    context overflow mode.
+    The result has the output data type `cls(_, wordlength, precision)`.
+    """
+
+    def __init__(self,
+                 cls: Type[_FixedPoint] = Fixb,
+                 wordlength: int = default_wordlength,
+                 precision: int = default_precision):
+        ctx = cls.get_current_context()
+        self._cls = cls
+        self._base = cls._base
+        self._overflow = ctx.overflow
+        self._rounding = ctx.rounding
+        self._inner_wordlength = ctx.wordlength
+        self._inner_precision = ctx.precision
+        self._inner_info = dtype_info(cls._base, True, ctx.wordlength,
+                                      ctx.precision)
+        self.wordlength = wordlength if wordlength is not None else ctx.wordlength
+        self.precision = precision if precision is not None else ctx.precision
+        self._info = dtype_info(cls._base, cls._signed, self.wordlength,
+                                self.precision)
+
+    def _compile(self, value: FromTypes) -> int:
+        """Stored integer of a constant at the intermediate precision."""
+        stored_integer = to_stored_integer(value, self._base,
+                                           self._inner_precision,
+                                           self._rounding)
+        return self._limit(stored_integer)
+
+    def _limit(self, stored_integer: int) -> int:
+        return handle_overflow(stored_integer, self._inner_info,
+                               self._inner_wordlength, self._overflow)
+
+    def _output(self, stored_integer: int) -> int:
+        stored_integer = rescale(stored_integer, self._base,
+                                 self._inner_precision, self.precision,
+                                 self._rounding)
+        return handle_overflow(stored_integer, self._info, self.wordlength,
+                               self._overflow)
+
+    def _evaluate(self, x: int, precision: int) -> int:
+        raise NotImplementedError
+
+    def __call__(self, x: _FixedPoint) -> Any:
+        """Evaluates a fixed-point scalar."""
+        if not isinstance(x, _FixedPoint) or x.base != self._base:
+            raise TypeError('Input {!r} must be a base-{} fixed-point value'.format(x, self._base))
+        return self._cls.from_int(self._evaluate(x.int, x.precision),
+                                  self.wordlength, self.precision)
+
+    def evaluate(self, stored_integers: Iterable[int], precision: int) -> List[int]:
+        """Evaluates an array of stored integers with the given precision.
+
+        Returns the stored integers of the results.
+        """
+        evaluate = self._evaluate
+        return [evaluate(x, precision) for x in stored_integers]
+
+
+class Polynomial(_Evaluator):
+    """Polynomial evaluated with Horner's scheme.
+
+    Coefficients are ordered from the highest power to the constant term.
+    """
+
+    def __init__(self,
+                 coefficients: Sequence[FromTypes],
+                 cls: Type[_FixedPoint] = Fixb,
+                 wordlength: int = default_wordlength,
+                 precision: int = default_precision):
+        super().__init__(cls, wordlength, precision)
+        if not coefficients:
+            raise ValueError('Polynomial requires at least one coefficient')
+        self.coefficients = tuple(coefficients)
+        self._coefficients = [self._compile(c) for c in coefficients]
+
+    def _evaluate(self, x: int, precision: int) -> int:
+        base = self._base
+        inner_precision = self._inner_precision
+        rounding = self._rounding
+        limit = self._limit
+        coefficients = self._coefficients
+        acc = coefficients[0]
+        for c in coefficients[1:]:
+            acc = rescale(acc * x, base, inner_precision + precision,
+                          inner_precision, rounding)
+            acc = limit(acc + c)
+        return self._output(acc)
+
+    def __repr__(self) -> str:
+        return '{}({}, {}, {}, {})'.format(self.__class__.__name__,
+                                           list(self.coefficients),
+                                           self._cls.__name__,
+                                           self.wordlength, self.precision)
+
+
+class LookupTable(_Evaluator):
+    """Lookup table with linear interpolation between breakpoints.
+
+    Inputs outside the breakpoints are clamped to the first or last value.
+    """
+
+    def __init__(self,
+                 breakpoints: Sequence[FromTypes],
+                 values: Sequence[FromTypes],
+                 cls: Type[_FixedPoint] = Fixb,
+                 wordlength: int = default_wordlength,
+                 precision: int = default_precision):
+        super().__init__(cls, wordlength, precision)
+        if len(breakpoints) != len(values):
+            raise ValueError('Breakpoints and values must have the same length')
+        if len(breakpoints) < 2:
+            raise ValueError('Lookup table requires at least two breakpoints')
+        self.breakpoints = tuple(breakpoints)
+        self.values = tuple(values)
+        self._breakpoints = [self._compile(b) for b in breakpoints]
+        self._values = [self._compile(v) for v in values]
+        if any(b0 >= b1 for b0, b1 in zip(self._breakpoints, self._breakpoints[1:])):
+            raise ValueError('Breakpoints must be strictly increasing at precision {}'.format(self._inner_precision))
+
+    def _evaluate(self, x: int, precision: int) -> int:
+        x = rescale(x, self._base, precision, self._inner_precision,
+                    self._rounding)
+        bp = self._breakpoints
+        values = self._values
+        if x <= bp[0]:
+            return self._output(values[0])
+        if x >= bp[-1]:
+            return self._output(values[-1])
+        i = bisect_right(bp, x) - 1
+        y = values[i] + round_div((values[i + 1] - values[i]) * (x - bp[i]),
+                                  bp[i + 1] - bp[i], self._rounding)
+        return self._output(self._limit(y))
+
+    def __repr__(self) -> str:
+        return '{}({}, {}, {}, {}, {})'.format(self.__class__.__name__,
+                                               list(self.breakpoints),
+                                               list(self.values),
+                                               self._cls.__name__,
+                                               self.wordlength, self.precision)
@@ -0,0 +1,172 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from typing import Callable, Optional, Type, Union
+
+from chainfix.analysis import ErrorAccumulator
+from chainfix.analysis import QuantizationStats
+from chainfix.binary import Fixb
+from chainfix.context import _Context
+from chainfix.context import BinaryContext
+from chainfix.context import get_binary_context
+from chainfix.context import get_decimal_context
+from chainfix.context import set_binary_context
+from chainfix.context import set_decimal_context
+from chainfix.fixed_point import _FixedPoint
+from chainfix.fixed_point import dtype_info
+from chainfix.fixed_point import handle_overflow
+from chainfix.fixed_point import to_stored_integer
+
+__all__ = ['Quantizer', 'simulate']
+
+Real = Union[float, Fraction]
+Pipeline = Callable[[float, Callable[[Real], Real]], Real]
+Generator = Callable[[random.Random], float]
+
+
+class Quantizer:
+    """Quantizes real numbers to a fixed-point data type.
+
+    Rounding and overflow follow `context`, and the data type is
+    `cls(_, context.wordlength, context.precision)`.  Returns the exact
+    real world value of the quantized number as a Fraction, and counts
+    overflows.  Inputs may be floats or Fractions, and are rounded
+    exactly.
+    """
+
+    def __init__(self, cls: Type[_FixedPoint], context: _Context):
+        self._base = cls._base
+        self._wordlength = context.wordlength
+        self._precision = context.precision
+        self._overflow = context.overflow
+        self._rounding = context.rounding
+        self._info = dtype_info(cls._base, cls._signed, context.wordlength,
+                                context.precision)
+        # Exact real world value of an LSB (the float scale of dtype_info is
+        # inexact for negative precisions)
+        self._lsb = Fraction(cls._base) ** -context.precision
+        self.overflows = 0
+
+    def __call__(self, x: Real) -> Fraction:
+        stored_integer = to_stored_integer(x, self._base, self._precision,
+                                           self._rounding)
+        limited = handle_overflow(stored_integer, self._info,
+                                  self._wordlength, self._overflow)
+        if limited != stored_integer:
+            self.overflows += 1
+        return limited * self._lsb
+
+
+def _float(x: float) -> float:
+    return x
+
+
+class _Uniform:
+    """Picklable uniform input generator."""
+
+    def __init__(self, low: float, high: float):
+        self.low = low
+        self.high = high
+
+    def __call__(self, rng: random.Random) -> float:
+        return rng.uniform(self.low, self.high)
+
+
+def _run_batch(pipeline: Pipeline, cls: Type[_FixedPoint], context: _Context,
+               generator: Generator, seed: int, index: int,
+               size: int) -> ErrorAccumulator:
+    """Runs the float and fixed-point pipelines over one batch."""
+    if isinstance(context, BinaryContext):
+        get_context, set_context = get_binary_context, set_binary_context
+    else:
+        get_context, set_context = get_decimal_context, set_decimal_context
+
+    # Deterministic per batch, regardless of how batches are scheduled
+    rng = random.Random('{}:{}'.format(seed, index))
+    acc = ErrorAccumulator()
+    quantizer = Quantizer(cls, context)
+    saved = get_context()
+    set_context(context.copy())
+    try:
+        for _ in range(size):
+            x = generator(rng)
+            quantizer.overflows = 0
+            reference = pipeline(x, _float)
+            quantized = pipeline(x, quantizer)
+            acc.add(reference, quantized, quantizer.overflows)
+    finally:
+        set_context(saved)
+    return acc
+
+
+def simulate(pipeline: Pipeline,
+             cls: Type[_FixedPoint] = Fixb,
+             context: Optional[_Context] = None,
+             samples: int = 10000,
+             low: float = -1.0,
+             high: float = 1.0,
+             generator: Optional[Generator] = None,
+             seed: int = 0,
+             batch_size: int = 1000,
+             processes: Optional[int] = None) -> QuantizationStats:
+    """Compares a float pipeline against its fixed-point version.
+
+    `pipeline(x, q)` computes an output from input `x`, calling `q` on
+    every value that is quantized in the fixed-point implementation.  It
+    is run twice per input: with `q` as the identity (float reference)
+    and with `q` quantizing to `cls(_, context.wordlength,
+    context.precision)` using the rounding and overflow of `context`
+    (default: the current context of `cls`).  The context is also made
+    current while the pipeline runs.
+
+    In the fixed-point run `q` returns Fractions, so arithmetic between
+    quantization nodes is exact and the result is bit-true.  Constants
+    should be ints, Fractions or quantized with `q`, since mixing in a
+    float turns the result back into a float.
+
+    Inputs are drawn uniformly from `low` to `high`, or from
+    `generator(rng)`.  Batches of inputs run across a process pool of
+    `processes` workers (inline if 1), each with its own seed derived
+    from `seed`, so results do not depend on the number of workers.
+    `pipeline` and `generator` must be picklable when using a pool.
+
+    Returns the error statistics of the fixed-point outputs; `overflows`
+    counts the quantizations that overflowed.
+    """
+    if context is None:
+        context = cls.get_current_context()
+    if context.base != cls._base:
+        raise ValueError('{} requires a base-{} context'.format(cls.__name__, cls._base))
+    context = context.copy()
+    if generator is None:
+        generator = _Uniform(low, high)
+
+    sizes = [min(batch_size, samples - start)
+             for start in range(0, samples, batch_size)]
+    args = [(pipeline, cls, context, generator, seed, index, size)
+            for index, size in enumerate(sizes)]
+
+    if processes == 1:
+        accs = [_run_batch(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(processes) as executor:
+            accs = list(executor.map(_run_batch, *zip(*args))) if args else []
+
+    total = ErrorAccumulator()
+    for acc in accs:
+        total.merge(acc)
+    return total.stats(context.wordlength, context.precision)
@@ -0,0 +1,108 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+import pytest
+
+from chainfix import find_dtype
+from chainfix import Fixb
+from chainfix import Fixd
+from chainfix import QuantizationAnalyzer
+from chainfix import Ufixb
+from chainfix.analysis import analyze
+from chainfix.analysis import required_wordlength
+from chainfix.analysis import value_range
+
+
+def test_value_range():
+    assert value_range(iter([3, -1.5, 2])) == (-1.5, 3)
+
+    with pytest.raises(ValueError):
+        value_range([])
+
+
+def test_required_wordlength():
+    assert required_wordlength(Fixb, -4, 3.75, 2) == 5
+    assert required_wordlength(Fixb, -4, 4, 2) == 6
+    assert required_wordlength(Ufixb, 0, 3.75, 2) == 4
+    assert required_wordlength(Fixd, -1.28, 1.27, 2) == 8
+
+    # All-positive and all-negative ranges
+    assert required_wordlength(Fixb, 7, 7, 0) == 4
+    assert required_wordlength(Fixb, -1, -1, 0) == 1
+    assert required_wordlength(Fixb, -8, -3, 0) == 4
+
+    with pytest.raises(ValueError):
+        required_wordlength(Ufixb, -1, 1, 0)
+
+
+def test_analyze_error_stats():
+    (exact, coarse) = analyze([0.25, -0.5, 1.0], Fixb, [(8, 2), (8, 0)])
+
+    assert exact.count == 3
+    assert exact.overflows == 0
+    assert exact.max_abs_error == 0
+    assert exact.rms_error == 0
+    assert exact.sqnr == math.inf
+
+    assert coarse.max_abs_error == 0.5
+    assert coarse.rms_error == pytest.approx(math.sqrt((0.25 ** 2 + 0.5 ** 2) / 3))
+    assert coarse.sqnr == pytest.approx(
+        10 * math.log10((0.25 ** 2 + 0.5 ** 2 + 1) / (0.25 ** 2 + 0.5 ** 2)))
+
+
+def test_analyze_overflow_saturates():
+    (stats,) = analyze([1.0, 2.0, 3.0], Fixb, [(3, 1)])
+
+    # Upper bound of Fixb(_, 3, 1) is 1.5
+    assert stats.overflows == 2
+    assert stats.max_abs_error == 1.5
+
+
+def test_analyzer_streaming():
+    analyzer = QuantizationAnalyzer(Fixb, [(None, p) for p in range(8)])
+    analyzer.update(x / 10 for x in range(-20, 0))
+    analyzer.update(x / 10 for x in range(0, 31))
+
+    assert analyzer.range == (-2.0, 3.0)
+    best = analyzer.best(max_error=0.02)
+    assert best.precision == 5
+    assert best.wordlength == required_wordlength(Fixb, -2.0, 3.0, 5)
+    assert best.count == 51
+
+    assert analyzer.best(max_error=1e-9) is None
+
+
+def test_find_dtype():
+    stats = find_dtype(iter([0.1, 0.2, 12.7]), Fixd, max_error=0)
+    assert (stats.wordlength, stats.precision) == (8, 1)
+
+    stats = find_dtype([math.pi], Fixb, min_sqnr=60)
+    assert stats.sqnr >= 60
+    assert stats.wordlength == stats.precision + 3
+
+    with pytest.raises(ValueError):
+        find_dtype([math.pi], Fixb, max_error=0, precisions=range(4))
+
+
+def test_find_dtype_constant_and_negative():
+    stats = find_dtype([-1.0, -1.0], Fixb, max_error=0)
+    assert (stats.wordlength, stats.precision) == (1, 0)
+
+    stats = find_dtype([7, 7, 7], Fixb, max_error=0)
+    assert (stats.wordlength, stats.precision) == (4, 0)
+
+    stats = find_dtype([-0.5, -0.25], Fixb, max_error=0)
+    assert (stats.wordlength, stats.precision) == (2, 2)
@@ -0,0 +1,109 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from chainfix import bitconcat
+from chainfix import bitslice
+from chainfix import FieldPacker
+from chainfix import Fixb
+from chainfix import Fixd
+from chainfix import Ufixb
+
+
+def test_uint():
+    assert Fixb(-2, 16, 0).uint == 0xfffe
+    assert Ufixb(33, 16, 0).uint == 33
+
+
+def test_shift():
+    x = Fixb(-2, 8, 0)
+    assert (x << 2).int == -8
+    assert (x << 7).int == 0
+    assert (x >> 1).int == -1
+    assert (Fixb(0.75, 8, 4) << 1).value == 1.5
+
+    u = Ufixb(0xf0, 8, 0)
+    assert (u << 1).int == 0xe0
+    assert (u >> 4).int == 0x0f
+    assert (u >> 4).wordlength == 8
+
+
+def test_bitwise():
+    a = Ufixb(0b1100, 4, 0)
+    b = Ufixb(0b1010, 4, 0)
+    assert (a & b).int == 0b1000
+    assert (a | b).int == 0b1110
+    assert (a ^ b).int == 0b0110
+    assert (~a).int == 0b0011
+
+    assert (Fixb(-1, 8, 0) & 0x0f).int == 15
+    assert (0x80 | Fixb(0, 8, 0)).int == -128
+    assert (~Fixb(0, 8, 0)).int == -1
+
+    with pytest.raises(TypeError):
+        a & Ufixb(0, 5, 0)
+
+    with pytest.raises(TypeError):
+        a & 1.5
+
+
+def test_bitslice_bitconcat():
+    x = Fixb(-2, 16, 0)
+    s = bitslice(x, 3, 0)
+    assert isinstance(s, Ufixb)
+    assert (s.wordlength, s.precision, s.int) == (4, 0, 0b1110)
+    assert bitslice(x, 15, 15).int == 1
+
+    with pytest.raises(ValueError):
+        bitslice(x, 16, 0)
+
+    c = bitconcat(Ufixb(0b101, 3, 0), Fixb(-1, 2, 0), Fixd(0, 4, 2))
+    assert (c.wordlength, c.bin) == (9, '0b101110000')
+
+
+def test_field_packer():
+    packer = FieldPacker([
+        ('mode', Ufixb, 2, 0),
+        ('gain', Fixb, 8, 4),
+        ('offset', Ufixb, 6, 6),
+    ])
+    assert packer.wordlength == 16
+    assert packer.names == ['mode', 'gain', 'offset']
+
+    word = packer.pack({'mode': 3, 'gain': Fixb(-1.5, 8, 4), 'offset': 0.25})
+    assert word == 0b11_11101000_010000
+
+    fields = packer.unpack(word)
+    assert fields['mode'].int == 3
+    assert fields['gain'].value == -1.5
+    assert fields['offset'].value == 0.25
+
+    with pytest.raises(ValueError):
+        packer.pack({'mode': 3, 'gain': Fixb(-1.5, 8, 3), 'offset': 0})
+
+
+def test_field_packer_bulk():
+    packer = FieldPacker([('hi', Fixb, 4, 0), ('lo', Ufixb, 4, 0)])
+    columns = {'hi': [-1, 0, 7], 'lo': [0, 15, 1]}
+
+    words = packer.pack_many(columns)
+    assert words == [0xf0, 0x0f, 0x71]
+    assert packer.unpack_many(words) == columns
+
+    with pytest.raises(ValueError):
+        packer.pack_many({'hi': [8], 'lo': [0]})
+
+    with pytest.raises(ValueError):
+        packer.pack_many({'hi': [0, 1], 'lo': [0]})
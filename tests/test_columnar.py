@@ -0,0 +1,152 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+
+import pytest
+
+from chainfix import Column
+from chainfix import Fixb
+from chainfix import Fixd
+from chainfix import load_column
+from chainfix import save_column
+from chainfix import Ufixb
+from chainfix import Ufixd
+from chainfix.columnar import save_ints
+
+
+@pytest.mark.parametrize('cls, wordlength, precision, values', [
+    (Fixb, 12, 4, [-128, -0.0625, 0, 127.9375]),
+    (Ufixb, 32, 16, [0, 1.5, 65535.99998474121]),
+    (Fixd, 64, 18, [-9.223372036854775, 0, 1e-18]),
+    (Ufixd, 256, 18, [0, 1.5, 1e40]),
+    (Fixd, 100, 0, [-2 ** 99, 2 ** 99 - 1]),
+])
+def test_round_trip(tmp_path, cls, wordlength, precision, values):
+    path = str(tmp_path / 'column.chfx')
+    values = [cls(v, wordlength, precision) for v in values]
+
+    assert save_column(path, iter(values)) == len(values)
+    column = load_column(path)
+
+    assert (column.cls, column.wordlength, column.precision) == (cls, wordlength, precision)
+    assert len(column) == len(values)
+    assert list(column.ints) == [x.int for x in values]
+    assert list(column) == values
+    assert type(column[0]) is cls
+    assert column[-1].int == values[-1].int
+    assert [x.int for x in column[1:]] == [x.int for x in values[1:]]
+
+
+def test_save_ints_streaming(tmp_path):
+    path = str(tmp_path / 'column.chfx')
+    n = 200000
+    assert save_ints(path, (i % 256 - 128 for i in range(n)), Fixb, 8, 0) == n
+
+    column = load_column(path)
+    assert len(column) == n
+    assert column.itemsize == 1
+    assert column.ints[n - 1] == (n - 1) % 256 - 128
+
+
+def test_save_errors(tmp_path):
+    path = str(tmp_path / 'column.chfx')
+
+    with pytest.raises(ValueError):
+        save_column(path, [])
+
+    with pytest.raises(ValueError):
+        save_column(path, [Fixb(0, 16, 4), Fixb(0, 16, 5)])
+
+    with pytest.raises(ValueError):
+        save_ints(path, [128], Fixb, 8, 0)
+
+
+def test_load_errors(tmp_path):
+    path = tmp_path / 'column.chfx'
+    path.write_bytes(b'not a column file at all, no no no')
+
+    with pytest.raises(ValueError):
+        load_column(str(path))
+
+
+def test_in_memory_column():
+    column = Column(Fixd, 16, 2, Fixd(-1.5, 16, 2).int.to_bytes(2, 'little', signed=True))
+    assert list(column) == [Fixd(-1.5, 16, 2)]
+
+    with pytest.raises(ValueError):
+        Column(Fixd, 16, 2, b'abc')
+
+
+@pytest.mark.parametrize('wordlength', [16, 256])
+def test_close(tmp_path, wordlength):
+    path = str(tmp_path / 'column.chfx')
+    save_column(path, [Fixd(1.5, wordlength, 2)])
+
+    with load_column(path) as column:
+        assert list(column) == [Fixd(1.5, wordlength, 2)]
+        mm = column._mmap
+    assert mm.closed
+    assert column._mmap is None
+    column.close()
+
+    with pytest.raises(ValueError):
+        len(column)
+
+
+def test_close_with_slices_in_use(tmp_path):
+    path = str(tmp_path / 'column.chfx')
+    save_ints(path, [1, 2, 3], Fixb, 16, 0)
+
+    column = load_column(path)
+    view = column.ints[0:2]
+    with pytest.raises(BufferError, match='slices'):
+        column.close()
+    assert not column._mmap.closed
+
+    del view
+    column.close()
+    assert column._mmap is None
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX file modes')
+def test_save_file_mode(tmp_path):
+    path = tmp_path / 'column.chfx'
+    umask = os.umask(0o022)
+    try:
+        save_ints(str(path), [1, 2], Fixb, 8, 0)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+        os.umask(0o077)
+        save_ints(str(path), [1, 2], Fixb, 8, 0)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    finally:
+        os.umask(umask)
+
+
+def test_failed_save_keeps_previous_file(tmp_path):
+    path = tmp_path / 'column.chfx'
+    save_ints(str(path), [1, 2], Fixb, 8, 0)
+
+    values = iter(list(range(-128, 128)) * 300 + [128])
+    with pytest.raises(ValueError):
+        save_ints(str(path), values, Fixb, 8, 0)
+
+    assert list(load_column(str(path)).ints) == [1, 2]
+    assert [p.name for p in tmp_path.iterdir()] == ['column.chfx']
+
+    new_path = tmp_path / 'new.chfx'
+    with pytest.raises(ValueError):
+        save_ints(str(new_path), [128], Fixb, 8, 0)
+    assert not new_path.exists()
@@ -204,3 +204,153 @@ def test_integer_ratio():
     n, d = x.as_integer_ratio()
     assert n == 17
     assert d == 8
+
+
+def test_immutable():
+    x = Fixd(1.5, 32, 2)
+    with pytest.raises(AttributeError):
+        x._int = 3
+    with pytest.raises(AttributeError):
+        x._precision = 3
+    with pytest.raises(AttributeError):
+        del x._wordlength
+    assert x.int == 150
+
+
+def test_copy_and_pickle():
+    import copy
+    import pickle
+
+    x = Fixb(-2.25, 16, 4)
+    assert copy.copy(x) is x
+    assert copy.deepcopy(x) is x
+
+    y = pickle.loads(pickle.dumps(x))
+    assert type(y) is Fixb
+    assert (y.int, y.wordlength, y.precision) == (x.int, 16, 4)
+
+
+def test_equality():
+    assert Fixd(1.5, 32, 2) == Fixd(1.5, 64, 6)
+    assert Fixd(1.5, 32, 2) == Ufixd(1.5, 16, 1)
+    assert Fixd(1.5, 32, 2) != Fixd(1.51, 32, 2)
+    assert Fixd(1.5, 32, 2) == Fixb(1.5, 32, 1)
+    assert Fixd(0.1, 32, 1) != Fixb(0.1, 32, 16)
+
+    assert Fixd(1.5, 32, 2) == 1.5
+    assert Fixd(3, 32, 2) == 3
+    assert Fixd(0.1, 32, 1) != 0.1
+    assert Fixd(0.1, 32, 1) != "0.1"
+
+
+def test_hash():
+    from fractions import Fraction
+
+    values = [Fixd(1.5, 32, 2), Fixd(1.5, 64, 6), Ufixd(1.5, 16, 1),
+              Fixb(1.5, 32, 1), Fixd(-0.01, 32, 3), Fixb(-1, 8, 0),
+              Fixd(0.1, 32, 1), Fixd(-1.23, 256, 18), Fixb(3, 8, -1)]
+    for x in values:
+        n, d = x.as_integer_ratio()
+        assert hash(x) == hash(Fraction(n, d))
+    assert hash(Fixd(1.5, 32, 2)) == hash(1.5)
+    assert hash(Fixb(-1, 8, 0)) == hash(-1)
+
+    prices = {Fixd(1.5, 32, 2): 'a'}
+    assert prices[Fixd(1.5, 256, 18)] == 'a'
+    assert prices[1.5] == 'a'
+    assert len({Fixd(1.5, 32, 2), Fixb(1.5, 32, 1), Ufixd(1.5, 16, 1)}) == 1
+
+
+def test_rounding_modes():
+    from chainfix.context import Rounding
+
+    ctx = get_decimal_context()
+    ctx_save = ctx.copy()
+    assert ctx.rounding is Rounding.HALF_EVEN
+
+    expected = {
+        Rounding.HALF_EVEN: [2, -2, 0, 2, -2],
+        Rounding.HALF_AWAY: [3, -3, 1, 2, -2],
+        Rounding.FLOOR: [2, -3, 0, 1, -2],
+        Rounding.CEIL: [3, -2, 1, 2, -1],
+        Rounding.TRUNCATE: [2, -2, 0, 1, -1],
+    }
+    values = [2.5, -2.5, 0.5, 1.9, -1.9]
+    for rounding, stored_integers in expected.items():
+        ctx.rounding = rounding
+        assert [Fixd(v, 16, 0).int for v in values] == stored_integers
+        assert Fixd.quantize(values, 16, 0) == stored_integers
+        assert Fixd.quantize(values, 16, 0, Rounding.HALF_EVEN) == expected[Rounding.HALF_EVEN]
+
+    set_decimal_context(ctx_save)
+
+
+def test_exact_rounding():
+    from chainfix.context import Rounding
+
+    # 0.1 is slightly above 1/10 as a float, 0.7 slightly below 7/10
+    assert Fixd.quantize([0.1, 0.7], 64, 16, Rounding.FLOOR) == [10 ** 15, 7 * 10 ** 15 - 1]
+    assert Fixd.quantize([0.1, 0.7], 64, 16, Rounding.CEIL) == [10 ** 15 + 1, 7 * 10 ** 15]
+
+    # Exact integer inputs, including beyond float precision
+    big = 2 ** 60 + 1
+    assert Fixd(big, 256, 18).int == big * 10 ** 18
+    assert Fixb(7, 8, -1).int == 4
+    assert Fixb.quantize([7, -7], 8, -1, Rounding.TRUNCATE) == [3, -3]
+
+    with pytest.raises(ValueError):
+        Fixb.quantize([128.0], 8, 0)
+    with pytest.raises(ValueError):
+        Fixb(float('inf'))
+    with pytest.raises(TypeError):
+        Fixb.quantize(['1'], 8, 0)
+
+
+def test_exact_float_stored_integer():
+    # Rounding applies to the exact value of the float, which for 0.1 and
+    # 0.3 differs from the decimal literal at 18 decimal places
+    assert Fixd(0.1, 256, 18).int == 100000000000000006
+    assert Fixd(0.3, 256, 18).int == 299999999999999989
+    assert Fixd.from_int(10 ** 17, 256, 18).int == 10 ** 17
+
+
+def test_stored_integer_fast_path():
+    import random
+
+    from chainfix.context import Rounding
+    from chainfix.fixed_point import exact_ratio
+    from chainfix.fixed_point import scale_ratio
+    from chainfix.fixed_point import to_stored_integer
+
+    rng = random.Random(0)
+    values = [0.0, 0.5, -0.5, 2.5, 0.1, 0.3, 5e-324, 1e300]
+    values += [rng.uniform(-1e3, 1e3) * 10.0 ** rng.randint(-20, 3) for _ in range(500)]
+    values += [rng.randint(-10 ** 6, 10 ** 6) / 1000 + 0.0005 for _ in range(500)]
+    for value in values:
+        n, d = exact_ratio(value)
+        for base in (2, 10):
+            precision = rng.randint(-5, 40)
+            for rounding in Rounding:
+                assert to_stored_integer(value, base, precision, rounding) == \
+                    scale_ratio(n, d, base, precision, rounding)
+
+
+def test_stored_integer_near_negative_half():
+    import math
+    from fractions import Fraction
+
+    from chainfix.context import Rounding
+    from chainfix.fixed_point import round_float
+    from chainfix.fixed_point import to_stored_integer
+
+    # value + 1 rounds to exactly 0.5 for these, so flooring first is wrong
+    value = -(0.5 - 2 ** -54)
+    assert round_float(value, Rounding.HALF_AWAY) == 0
+    assert round_float(-value, Rounding.HALF_AWAY) == 0
+    for shift in (-40, -16, -1, 0):
+        x = math.ldexp(value, shift)
+        for base in (2, 10):
+            for rounding in Rounding:
+                assert to_stored_integer(x, base, -shift, rounding) == \
+                    to_stored_integer(Fraction(x), base, -shift, rounding)
+    assert Fixb.quantize([math.ldexp(value, -16)], 32, 16, Rounding.HALF_AWAY) == [0]
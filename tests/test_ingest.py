@@ -0,0 +1,94 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from chainfix import Fixd
+from chainfix import ingest
+from chainfix import Ufixd
+
+
+async def fake_logs(items):
+    """Stands in for a chain event log subscription."""
+    for item in items:
+        yield item
+
+
+async def collect(source, **kwargs):
+    return [batch async for batch in ingest(source, **kwargs)]
+
+
+def test_ingest_groups_by_decimals():
+    max_uint256 = 2 ** 256 - 1
+    logs = [(10 ** 18, 18), ('0x0f4240', 6), (max_uint256, 18), (5, 6), (7, 18)]
+
+    batches = asyncio.run(collect(fake_logs(logs), batch_size=2))
+
+    assert [(b.precision, [x.int for x in b.values]) for b in batches] == [
+        (18, [10 ** 18, max_uint256]),
+        (6, [1000000, 5]),
+        (18, [7]),
+    ]
+    x = batches[0].values[0]
+    assert isinstance(x, Ufixd)
+    assert (x.wordlength, x.precision, x.value) == (256, 18, 1.0)
+
+
+def test_ingest_default_decimals():
+    batches = asyncio.run(collect(fake_logs([1, '0xff']), decimals=2,
+                                  cls=Fixd, wordlength=64))
+
+    (batch,) = batches
+    assert (batch.wordlength, batch.precision) == (64, 2)
+    assert [x.value for x in batch.values] == [0.01, 2.55]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect(fake_logs([1])))
+
+    with pytest.raises(TypeError):
+        asyncio.run(collect(fake_logs([(1.5, 2)])))
+
+
+def test_ingest_requires_hex_prefix():
+    (batch,) = asyncio.run(collect(fake_logs([('0XDE0B6B3A7640000', 18)])))
+    assert batch.values[0].value == 1.0
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect(fake_logs([('1000000000000000000', 18)])))
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect(fake_logs([('ff', 18)])))
+
+
+def test_ingest_yields_to_event_loop():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        counts = []
+        async for _ in ingest(fake_logs([(i, 18) for i in range(10)]), batch_size=2):
+            counts.append(len(ticks))
+        task.cancel()
+        return counts
+
+    counts = asyncio.run(main())
+    assert len(counts) == 5
+    assert counts == sorted(set(counts))
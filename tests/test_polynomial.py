@@ -0,0 +1,105 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from chainfix import BinaryContext
+from chainfix import Fixb
+from chainfix import Fixd
+from chainfix import get_binary_context
+from chainfix import LookupTable
+from chainfix import Polynomial
+from chainfix import set_binary_context
+from chainfix import Ufixb
+from chainfix.context import Overflow
+
+
+def test_polynomial_scalar():
+    # 0.5 x^2 - x + 2
+    p = Polynomial([0.5, -1, 2], Fixb, 16, 8)
+
+    y = p(Fixb(3, 16, 8))
+    assert isinstance(y, Fixb)
+    assert (y.wordlength, y.precision) == (16, 8)
+    assert y.value == 3.5
+
+    assert p(Fixb(-1.5, 12, 4)).value == 4.625
+
+
+def test_polynomial_stored_integers():
+    p = Polynomial([0.5, -1, 2], Fixb, 16, 8)
+    x = [Fixb(v, 16, 4).int for v in (0, 1, 2.5, -2)]
+    assert p.evaluate(x, 4) == [Fixb(v, 16, 8).int for v in (2, 1.5, 2.625, 6)]
+
+
+def test_polynomial_context_rounding():
+    ctx = get_binary_context()
+    set_binary_context(BinaryContext(32, 2))
+    try:
+        p = Polynomial([1, 0.125, 0], Fixb, 16, 8)
+    finally:
+        set_binary_context(ctx)
+
+    # 0.125 rounds to 0.0 with 2 fractional bits of intermediate precision
+    assert p(Fixb(1, 16, 8)).value == 1
+    assert Polynomial([1, 0.125, 0], Fixb, 16, 8)(Fixb(1, 16, 8)).value == 1.125
+
+
+def test_polynomial_context_overflow():
+    ctx = get_binary_context()
+    set_binary_context(BinaryContext(8, 4, Overflow.SATURATE))
+    try:
+        saturate = Polynomial([1, 0, 0], Fixb, 16, 4)
+        get_binary_context().overflow = Overflow.WRAP
+        wrap = Polynomial([1, 0, 0], Fixb, 16, 4)
+    finally:
+        set_binary_context(ctx)
+
+    # 3 ** 2 exceeds the 8 bit intermediate range of -8 to 7.9375
+    assert saturate(Fixb(3, 16, 4)).value == 7.9375
+    assert wrap(Fixb(3, 16, 4)).value == -7
+
+
+def test_polynomial_errors():
+    with pytest.raises(ValueError):
+        Polynomial([])
+
+    with pytest.raises(TypeError):
+        Polynomial([1, 0])(Fixd(1, 16, 2))
+
+
+def test_lookup_table():
+    lut = LookupTable([0, 1, 2, 4], [0, 2, 3, 2], Ufixb, 16, 8)
+
+    assert lut(Fixb(0.5, 16, 8)).value == 1
+    assert lut(Fixb(3, 16, 8)).value == 2.5
+    assert lut(Fixb(1, 16, 8)).value == 2
+
+    # Clamped outside the breakpoints
+    assert lut(Fixb(-1, 16, 8)).value == 0
+    assert lut(Fixb(10, 16, 8)).value == 2
+
+    x = [Fixb(v, 16, 2).int for v in (0.25, 1.5, 3.75)]
+    assert lut.evaluate(x, 2) == [Ufixb(v, 16, 8).int for v in (0.5, 2.5, 2.125)]
+
+
+def test_lookup_table_errors():
+    with pytest.raises(ValueError):
+        LookupTable([0, 1], [0, 1, 2])
+
+    with pytest.raises(ValueError):
+        LookupTable([0], [0])
+
+    with pytest.raises(ValueError):
+        LookupTable([0, 1e-9], [0, 1])
@@ -0,0 +1,139 @@
+# Copyright 2021 PyDefi Development Team
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from fractions import Fraction
+
+import pytest
+
+from chainfix import BinaryContext
+from chainfix import DecimalContext
+from chainfix import Fixb
+from chainfix import Fixd
+from chainfix import get_binary_context
+from chainfix import simulate
+from chainfix.context import Overflow
+from chainfix.context import Rounding
+from chainfix.fixed_point import round_div
+from chainfix.simulation import Quantizer
+
+
+def gain_pipeline(x, q):
+    """Quantized input, scaled by 3 and quantized again."""
+    return q(3 * q(x))
+
+
+def context_pipeline(x, q):
+    # Fixed-point values built inside the pipeline use the context under test
+    assert Fixb(x).wordlength == 32
+    assert Fixb(x).precision == 12
+    return q(x)
+
+
+def product_pipeline(x, q):
+    return q(q(x) * q(1 - x))
+
+
+def test_quantizer():
+    q = Quantizer(Fixb, BinaryContext(8, 4, Overflow.SATURATE, Rounding.FLOOR))
+    assert q(0.99) == Fraction(15, 16)
+    assert q(-0.01) == -0.0625
+    assert q.overflows == 0
+    assert q(10) == 7.9375
+    assert q.overflows == 1
+
+    # Negative precision: the LSB is 4
+    q = Quantizer(Fixb, BinaryContext(8, -2))
+    assert q(9.5) == 8
+    assert q(-6) == -8
+    assert q(1000) == 508
+    assert q.overflows == 1
+    assert isinstance(q(9.5), Fraction)
+
+
+@pytest.mark.parametrize('cls, context', [
+    (Fixb, BinaryContext(64, 40)),
+    (Fixd, DecimalContext(256, 18)),
+])
+def test_quantizer_bit_true(cls, context):
+    rng = random.Random(0)
+    scale = cls._base ** context.precision
+    for _ in range(2000):
+        x = rng.uniform(-100, 100)
+        q = Quantizer(cls, context)
+
+        # Reference in stored integer arithmetic
+        a = cls(x, context.wordlength, context.precision).int
+        b = cls(1 - x, context.wordlength, context.precision).int
+        product = round_div(a * b, scale)
+
+        assert product_pipeline(x, q) == Fraction(product, scale)
+        assert q.overflows == 0
+
+
+def test_simulate_inline():
+    stats = simulate(gain_pipeline, Fixb, BinaryContext(16, 8), samples=2500,
+                     batch_size=1000, processes=1)
+
+    assert (stats.wordlength, stats.precision) == (16, 8)
+    assert stats.count == 2500
+    assert stats.overflows == 0
+    # Input rounding error (up to half an LSB) is amplified by the gain
+    assert 0 < stats.max_abs_error <= 3 * 2 ** -9 + 2 ** -9
+    assert stats.rms_error < stats.max_abs_error
+    assert stats.sqnr > 40
+
+
+def test_simulate_negative_precision():
+    stats = simulate(gain_pipeline, Fixb, BinaryContext(16, -2), samples=200,
+                     low=-1000, high=1000, processes=1)
+
+    assert (stats.wordlength, stats.precision) == (16, -2)
+    assert stats.count == 200
+    assert stats.overflows == 0
+    assert 0 < stats.max_abs_error <= 3 * 2 + 2
+
+
+def test_simulate_overflow_and_generator():
+    stats = simulate(gain_pipeline, Fixb, BinaryContext(8, 6), samples=100,
+                     generator=lambda rng: 1.0, processes=1)
+
+    # 3.0 exceeds the upper bound of Fixb(_, 8, 6)
+    assert stats.overflows == 100
+    assert stats.max_abs_error == pytest.approx(3 - 127 / 64)
+
+
+def test_simulate_swaps_context():
+    ctx = get_binary_context()
+    precision = ctx.precision
+
+    stats = simulate(context_pipeline, Fixb, BinaryContext(32, 12),
+                     samples=10, processes=1)
+    assert stats.max_abs_error <= 2 ** -13
+    assert get_binary_context().precision == precision
+
+    with pytest.raises(ValueError):
+        simulate(gain_pipeline, Fixd, BinaryContext(16, 8), processes=1)
+
+
+def test_simulate_deterministic_across_processes():
+    kwargs = dict(cls=Fixd, context=DecimalContext(32, 3), samples=600,
+                  low=-5, high=5, seed=7, batch_size=100)
+
+    inline = simulate(gain_pipeline, processes=1, **kwargs)
+    pooled = simulate(gain_pipeline, processes=2, **kwargs)
+
+    assert inline == pooled
+    assert inline != simulate(gain_pipeline, processes=1,
+                              **dict(kwargs, seed=8))